@@ -8,7 +8,7 @@ provider SDK clients on demand.
 from __future__ import annotations
 
 import os
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 
 _PROVIDER_ENV_VARS = {
@@ -18,6 +18,33 @@ _PROVIDER_ENV_VARS = {
     "groq": "GROQ_API_KEY",
 }
 
+# Constructed provider clients keyed by normalized provider name.
+_CLIENT_CACHE: Dict[str, Any] = {}
+
+# Resolved key values keyed by environment variable name. Only non-empty values
+# are cached so a key exported after a failed lookup is still picked up.
+_ENV_CACHE: Dict[str, str] = {}
+
+
+def _cached_env(var_name: str) -> Optional[str]:
+    """Return an environment variable value, caching it after the first hit."""
+    value = _ENV_CACHE.get(var_name)
+    if value is None:
+        value = os.environ.get(var_name)
+        if value:
+            _ENV_CACHE[var_name] = value
+    return value
+
+
+def clear_key_cache() -> None:
+    """Forget cached API key values so the next lookup re-reads the environment."""
+    _ENV_CACHE.clear()
+
+
+def reset_clients() -> None:
+    """Drop cached provider clients so the next ``get_client`` call rebuilds them."""
+    _CLIENT_CACHE.clear()
+
 
 def _get_required_env_var(var_name: str, provider: str) -> str:
     """Return a required environment variable.
@@ -32,7 +59,7 @@ def _get_required_env_var(var_name: str, provider: str) -> str:
     Raises:
         RuntimeError: If the environment variable is missing or empty.
     """
-    value = os.getenv(var_name)
+    value = _cached_env(var_name)
     if value:
         return value
     raise RuntimeError(
@@ -89,7 +116,7 @@ def validate_all() -> Dict[str, List[str]]:
     missing: List[str] = []
 
     for provider, env_var in _PROVIDER_ENV_VARS.items():
-        if os.getenv(env_var):
+        if _cached_env(env_var):
             available.append(provider)
         else:
             missing.append(provider)
@@ -97,9 +124,45 @@ def validate_all() -> Dict[str, List[str]]:
     return {"available": available, "missing": missing}
 
 
+def _make_anthropic() -> Any:
+    from anthropic import Anthropic
+
+    return Anthropic(api_key=get_anthropic_api_key())
+
+
+def _make_openai() -> Any:
+    from openai import OpenAI
+
+    return OpenAI(api_key=get_openai_api_key())
+
+
+def _make_google() -> Any:
+    import google.generativeai as genai
+
+    genai.configure(api_key=get_google_api_key())
+    return genai
+
+
+def _make_groq() -> Any:
+    from groq import Groq
+
+    return Groq(api_key=get_groq_api_key())
+
+
+_CLIENT_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "anthropic": _make_anthropic,
+    "openai": _make_openai,
+    "google": _make_google,
+    "groq": _make_groq,
+}
+
+
 def get_client(provider: str):
     """Return an initialized API client for a supported provider.
 
+    Only the requested provider SDK is imported. The client is built once per
+    provider and reused by later calls until ``reset_clients`` is called.
+
     Args:
         provider: Provider name. Supported values are ``anthropic``, ``openai``,
             ``google``, and ``groq``.
@@ -115,29 +178,18 @@ def get_client(provider: str):
     """
     normalized = provider.lower().strip()
 
-    if normalized == "anthropic":
-        from anthropic import Anthropic
-
-        return Anthropic(api_key=get_anthropic_api_key())
-
-    if normalized == "openai":
-        from openai import OpenAI
-
-        return OpenAI(api_key=get_openai_api_key())
-
-    if normalized == "google":
-        import google.generativeai as genai
-
-        genai.configure(api_key=get_google_api_key())
-        return genai
-
-    if normalized == "groq":
-        from groq import Groq
-
-        return Groq(api_key=get_groq_api_key())
-
-    supported = ", ".join(sorted(_PROVIDER_ENV_VARS.keys()))
-    raise ValueError(
-        f"Unsupported provider '{provider}'. "
-        f"Supported providers: {supported}."
-    )
+    client = _CLIENT_CACHE.get(normalized)
+    if client is not None:
+        return client
+
+    factory = _CLIENT_FACTORIES.get(normalized)
+    if factory is None:
+        supported = ", ".join(sorted(_CLIENT_FACTORIES))
+        raise ValueError(
+            f"Unsupported provider '{provider}'. "
+            f"Supported providers: {supported}."
+        )
+
+    client = factory()
+    _CLIENT_CACHE[normalized] = client
+    return client
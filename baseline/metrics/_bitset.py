@@ -0,0 +1,90 @@
+"""Bitset-packed token history for vectorized Jaccard similarity."""
+
+from typing import Dict, FrozenSet, Optional, Tuple
+
+import numpy as np
+
+if hasattr(np, "bitwise_count"):
+
+    def _popcount_rows(bits: np.ndarray) -> np.ndarray:
+        """Return the number of set bits in each row of a uint64 matrix."""
+        return np.bitwise_count(bits).sum(axis=1, dtype=np.int64)
+
+else:
+    _POPCOUNT_LUT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+    def _popcount_rows(bits: np.ndarray) -> np.ndarray:
+        """Return the number of set bits in each row of a uint64 matrix."""
+        return _POPCOUNT_LUT[bits.view(np.uint8)].sum(axis=1, dtype=np.int64)
+
+
+class TokenBitsetHistory:
+    """Session history of token sets stored as rows of a packed bit matrix.
+
+    Each distinct token gets an integer ID from a session-scoped vocabulary, so
+    a token set becomes a row of ``uint64`` words with one bit per token. The
+    Jaccard similarity of a new token set against every stored row is then a
+    single vectorized AND plus popcount instead of one set intersection per
+    prior response.
+    """
+
+    def __init__(self) -> None:
+        self._vocab: Dict[str, int] = {}
+        self._bits = np.zeros((8, 1), dtype=np.uint64)
+        self._sizes = np.zeros(8, dtype=np.int64)
+        self._count = 0
+        self._last: Optional[Tuple[FrozenSet[str], np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _encode(self, tokens: FrozenSet[str]) -> np.ndarray:
+        """Pack ``tokens`` into a bit row, assigning IDs to unseen tokens."""
+        if self._last is not None and self._last[0] is tokens:
+            return self._last[1]
+
+        vocab = self._vocab
+        ids = np.fromiter(
+            (vocab.setdefault(token, len(vocab)) for token in tokens),
+            dtype=np.uint64,
+            count=len(tokens),
+        )
+        row = np.zeros(max(1, (len(vocab) + 63) // 64), dtype=np.uint64)
+        np.bitwise_or.at(row, ids >> np.uint64(6), np.uint64(1) << (ids & np.uint64(63)))
+
+        self._last = (tokens, row)
+        return row
+
+    def similarities(self, tokens: FrozenSet[str]) -> np.ndarray:
+        """Return Jaccard similarity of ``tokens`` against each stored token set.
+
+        Args:
+            tokens: Token set to compare.
+
+        Returns:
+            A float array with one similarity per stored row, in insertion
+            order. Two empty sets compare as 1.0.
+        """
+        row = self._encode(tokens)
+        width = min(len(row), self._bits.shape[1])
+        intersections = _popcount_rows(self._bits[: self._count, :width] & row[:width])
+        unions = self._sizes[: self._count] + len(tokens) - intersections
+        return np.where(unions > 0, intersections / np.maximum(unions, 1), 1.0)
+
+    def append(self, tokens: FrozenSet[str]) -> None:
+        """Store ``tokens`` as the next row of the history."""
+        row = self._encode(tokens)
+        rows, words = self._bits.shape
+        if self._count == rows or len(row) > words:
+            new_rows = rows * 2 if self._count == rows else rows
+            new_words = max(len(row), words * 2) if len(row) > words else words
+            grown = np.zeros((new_rows, new_words), dtype=np.uint64)
+            grown[:rows, :words] = self._bits
+            self._bits = grown
+            sizes = np.zeros(new_rows, dtype=np.int64)
+            sizes[:rows] = self._sizes
+            self._sizes = sizes
+
+        self._bits[self._count, : len(row)] = row
+        self._sizes[self._count] = len(tokens)
+        self._count += 1
@@ -0,0 +1,33 @@
+"""Shared text helpers for overlap-based baseline metrics."""
+
+import re
+from typing import FrozenSet
+
+# Runs of word characters joined by inner apostrophes, so contractions ("i'm")
+# stay whole while surrounding punctuation, quotes, and lone apostrophes are
+# dropped ("'hello'," -> "hello").
+_TOKEN_RE = re.compile(r"\w+(?:'\w+)*")
+
+
+def _tokenize(text: str) -> FrozenSet[str]:
+    """Convert text into a normalized token set for overlap comparison."""
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+def _jaccard_tokens(tokens_a: FrozenSet[str], tokens_b: FrozenSet[str]) -> float:
+    """Calculate Jaccard similarity between two pre-tokenized sets."""
+    if not tokens_a and not tokens_b:
+        return 1.0
+    if not tokens_a or not tokens_b:
+        return 0.0
+
+    # Set intersection already iterates the smaller operand in C; counting with a
+    # Python-level loop over the smaller set measured ~2.5x slower.
+    intersection = len(tokens_a & tokens_b)
+    union = len(tokens_a) + len(tokens_b) - intersection
+    return intersection / union
+
+
+def _jaccard_similarity(a: str, b: str) -> float:
+    """Calculate Jaccard similarity between two strings using word tokens."""
+    return _jaccard_tokens(_tokenize(a), _tokenize(b))
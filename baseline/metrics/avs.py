@@ -2,13 +2,16 @@
 
 from typing import Dict, List
 
-_ANCHOR_PHRASES = [
-    "I think",
-    "my understanding",
-    "I'm uncertain",
-    "I don't know",
-    "in this conversation",
-]
+_ANCHOR_PHRASES_LOWER = tuple(
+    phrase.lower()
+    for phrase in [
+        "I think",
+        "my understanding",
+        "I'm uncertain",
+        "I don't know",
+        "in this conversation",
+    ]
+)
 
 
 def avs(response: str, probe: Dict, prior_responses: List[str] = []) -> float:
@@ -31,6 +34,6 @@ def avs(response: str, probe: Dict, prior_responses: List[str] = []) -> float:
     del probe, prior_responses
 
     response_lower = response.lower()
-    matches = sum(1 for phrase in _ANCHOR_PHRASES if phrase.lower() in response_lower)
+    matches = sum(1 for phrase in _ANCHOR_PHRASES_LOWER if phrase in response_lower)
     score = matches / 3
     return max(0.0, min(1.0, score))
@@ -1,26 +1,8 @@
 """Session drift baseline metric."""
 
-from typing import Dict, List, Set
+from typing import Dict, List
 
-
-def _tokenize(text: str) -> Set[str]:
-    """Convert text into a normalized token set for overlap comparison."""
-    return {token for token in text.lower().split() if token}
-
-
-def _jaccard_similarity(a: str, b: str) -> float:
-    """Calculate Jaccard similarity between two strings using word tokens."""
-    tokens_a = _tokenize(a)
-    tokens_b = _tokenize(b)
-
-    if not tokens_a and not tokens_b:
-        return 1.0
-    if not tokens_a or not tokens_b:
-        return 0.0
-
-    intersection = len(tokens_a & tokens_b)
-    union = len(tokens_a | tokens_b)
-    return intersection / union
+from baseline.metrics._text import _jaccard_similarity
 
 
 def drift(response: str, probe: Dict, prior_responses: List[str] = []) -> float:
@@ -1,26 +1,9 @@
 """Identity Consistency Index baseline metric."""
 
-from typing import Dict, List, Set
+from typing import Dict, FrozenSet, List, Sequence
 
-
-def _tokenize(text: str) -> Set[str]:
-    """Convert text into a normalized token set for overlap comparison."""
-    return {token for token in text.lower().split() if token}
-
-
-def _jaccard_similarity(a: str, b: str) -> float:
-    """Calculate Jaccard similarity between two strings using word tokens."""
-    tokens_a = _tokenize(a)
-    tokens_b = _tokenize(b)
-
-    if not tokens_a and not tokens_b:
-        return 1.0
-    if not tokens_a or not tokens_b:
-        return 0.0
-
-    intersection = len(tokens_a & tokens_b)
-    union = len(tokens_a | tokens_b)
-    return intersection / union
+from baseline.metrics._bitset import TokenBitsetHistory
+from baseline.metrics._text import _jaccard_tokens, _tokenize
 
 
 def ici(response: str, probe: Dict, prior_responses: List[str] = []) -> float:
@@ -42,9 +25,51 @@ def ici(response: str, probe: Dict, prior_responses: List[str] = []) -> float:
     """
     del probe
 
-    if not prior_responses:
+    return ici_from_tokens(
+        _tokenize(response), [_tokenize(prior) for prior in prior_responses]
+    )
+
+
+def ici_from_tokens(
+    response_tokens: FrozenSet[str], prior_token_sets: Sequence[FrozenSet[str]]
+) -> float:
+    """Compute Identity Consistency Index from pre-tokenized responses.
+
+    Equivalent to ``ici`` but lets callers tokenize each response once and
+    reuse the token sets as the session history grows.
+
+    Args:
+        response_tokens: Token set for the current response.
+        prior_token_sets: Token sets for earlier responses in the same session.
+
+    Returns:
+        A float in [0.0, 1.0]. If no prior token sets are provided, returns 1.0
+        because inconsistency cannot be detected.
+    """
+    if not prior_token_sets:
         return 1.0
 
-    similarities = [_jaccard_similarity(response, prior) for prior in prior_responses]
+    similarities = [_jaccard_tokens(response_tokens, prior) for prior in prior_token_sets]
     score = sum(similarities) / len(similarities)
     return max(0.0, min(1.0, score))
+
+
+def ici_from_history(response_tokens: FrozenSet[str], history: TokenBitsetHistory) -> float:
+    """Compute Identity Consistency Index against a bitset-packed session history.
+
+    Equivalent to ``ici_from_tokens`` but scores every prior response with one
+    vectorized pass, which pays off as the session history grows.
+
+    Args:
+        response_tokens: Token set for the current response.
+        history: Token sets for earlier responses in the same session.
+
+    Returns:
+        A float in [0.0, 1.0]. If the history is empty, returns 1.0 because
+        inconsistency cannot be detected.
+    """
+    if not len(history):
+        return 1.0
+
+    score = float(history.similarities(response_tokens).mean())
+    return max(0.0, min(1.0, score))
@@ -1,6 +1,31 @@
 """Response Stability Index baseline metric."""
 
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+_SIGNALS_LOWER_KEY = "_instability_signals_lower"
+
+
+def lower_signals(probe: Dict) -> Tuple[str, ...]:
+    """Return the probe's instability signals lowercased, caching them on the probe.
+
+    The tuple is stored under ``_instability_signals_lower`` so later calls with
+    the same probe dictionary skip the lowercasing. Callers that change
+    ``instability_signals`` afterwards must drop that key.
+
+    Args:
+        probe: Probe definition dictionary, expected to include
+            ``instability_signals`` as a list of strings.
+
+    Returns:
+        Lowercased signals in configuration order.
+    """
+    signals_lower = probe.get(_SIGNALS_LOWER_KEY)
+    if signals_lower is None:
+        signals_lower = tuple(
+            str(signal).lower() for signal in probe.get("instability_signals", [])
+        )
+        probe[_SIGNALS_LOWER_KEY] = signals_lower
+    return signals_lower
 
 
 def rsi(response: str, probe: Dict, prior_responses: List[str] = []) -> float:
@@ -22,14 +47,12 @@ def rsi(response: str, probe: Dict, prior_responses: List[str] = []) -> float:
     """
     del prior_responses
 
-    instability_signals = probe.get("instability_signals", [])
-    if not instability_signals:
+    signals_lower = lower_signals(probe)
+    if not signals_lower:
         return 1.0
 
     response_lower = response.lower()
-    found_count = sum(
-        1 for signal in instability_signals if str(signal).lower() in response_lower
-    )
+    found_count = sum(1 for signal in signals_lower if signal in response_lower)
 
-    score = 1.0 - (found_count / len(instability_signals))
+    score = 1.0 - (found_count / len(signals_lower))
     return max(0.0, min(1.0, score))
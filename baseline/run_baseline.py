@@ -2,6 +2,9 @@
 
 This module loads probe prompts, executes one single-turn call per probe against a
 configured provider client, computes baseline metrics, and writes a JSON artifact.
+The artifact is written to a temporary file and moved into place once complete.
+Provider calls may be issued concurrently; metrics are always computed afterwards
+in probe order, so session history semantics do not depend on completion order.
 
 Failure modes:
 - Raises ``ValueError`` for unsupported providers or unknown probe IDs.
@@ -12,18 +15,36 @@ Failure modes:
 from __future__ import annotations
 
 import argparse
+import copy
+import functools
+import hashlib
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from statistics import mean
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:  # optional faster serializer for the results payload
+    orjson = None
+
 from baseline.keys import get_client
+from baseline.metrics._bitset import TokenBitsetHistory
+from baseline.metrics._text import _tokenize
 from baseline.metrics.avs import avs
-from baseline.metrics.ici import ici
-from baseline.metrics.rsi import rsi
+from baseline.metrics.ici import ici_from_history, ici_from_tokens
+from baseline.metrics.rsi import lower_signals, rsi
 
 MODEL_DEFAULTS: Dict[str, str] = {
     "anthropic": "claude-3-5-sonnet-20241022",
@@ -33,12 +54,36 @@ MODEL_DEFAULTS: Dict[str, str] = {
 }
 
 _MAX_RESPONSE_TOKENS = 300
+# Session length at which ICI switches from per-pair frozenset intersections to
+# the NumPy bitset history; below this the fixed NumPy overhead dominates.
+_BITSET_HISTORY_THRESHOLD = 32
 _TEMPERATURE = 0.7
 
+_CACHE_ENV_VAR = "RC_BASELINE_CACHE"
+_DEFAULT_CACHE_DIR = Path("~/.cache/rc-baseline")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_probes_cached(path_str: str, mtime_ns: int) -> Tuple[Dict[str, Any], ...]:
+    """Parse a probes file once per (path, modification time) pair."""
+    del mtime_ns
+
+    with open(path_str, "r", encoding="utf-8") as handle:
+        data = yaml.load(handle, Loader=_YamlLoader) or {}
+
+    probes = data.get("probes")
+    if not isinstance(probes, list):
+        raise RuntimeError(f"Invalid probes file: expected list at 'probes' in {path_str}.")
+    return tuple(probes)
+
 
 def load_probes(path: Path) -> List[Dict[str, Any]]:
     """Load probe definitions from a YAML file.
 
+    Parsed probes are cached per path and modification time (a handful of
+    entries), so repeated runs in one process only re-parse the file after it
+    changes. Each call returns a deep copy, so callers may mutate the result.
+
     Args:
         path: YAML file path containing a top-level ``probes`` list.
 
@@ -48,13 +93,7 @@ def load_probes(path: Path) -> List[Dict[str, Any]]:
     Raises:
         RuntimeError: If YAML does not contain a valid ``probes`` list.
     """
-    with path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
-
-    probes = data.get("probes")
-    if not isinstance(probes, list):
-        raise RuntimeError(f"Invalid probes file: expected list at 'probes' in {path}.")
-    return probes
+    return copy.deepcopy(list(_load_probes_cached(str(path), path.stat().st_mtime_ns)))
 
 
 def _extract_text_from_anthropic(response: Any) -> str:
@@ -88,6 +127,46 @@ def _extract_text_from_openai_like(response: Any) -> str:
     return str(text).strip()
 
 
+def _generate_anthropic(client: Any, prompt: str, model: str) -> str:
+    response = client.messages.create(
+        model=model,
+        max_tokens=_MAX_RESPONSE_TOKENS,
+        temperature=_TEMPERATURE,
+        messages=[{"role": "user", "content": prompt}],
+    )
+    return _extract_text_from_anthropic(response)
+
+
+def _generate_openai_like(client: Any, prompt: str, model: str) -> str:
+    response = client.chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=_MAX_RESPONSE_TOKENS,
+        temperature=_TEMPERATURE,
+    )
+    return _extract_text_from_openai_like(response)
+
+
+def _generate_google(client: Any, prompt: str, model: str) -> str:
+    model_client = client.GenerativeModel(model_name=model)
+    response = model_client.generate_content(
+        prompt,
+        generation_config={
+            "temperature": _TEMPERATURE,
+            "max_output_tokens": _MAX_RESPONSE_TOKENS,
+        },
+    )
+    return str(getattr(response, "text", "")).strip()
+
+
+_GENERATE_HANDLERS: Dict[str, Callable[[Any, str, str], str]] = {
+    "anthropic": _generate_anthropic,
+    "openai": _generate_openai_like,
+    "google": _generate_google,
+    "groq": _generate_openai_like,
+}
+
+
 def generate_response(client: Any, provider: str, prompt: str, model: str) -> str:
     """Generate a single-turn response for one provider.
 
@@ -104,46 +183,12 @@ def generate_response(client: Any, provider: str, prompt: str, model: str) -> st
         RuntimeError: If provider response cannot be extracted.
         ValueError: If provider is unsupported.
     """
-    provider_norm = provider.lower().strip()
-
-    if provider_norm == "anthropic":
-        response = client.messages.create(
-            model=model,
-            max_tokens=_MAX_RESPONSE_TOKENS,
-            temperature=_TEMPERATURE,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        text = _extract_text_from_anthropic(response)
-    elif provider_norm == "openai":
-        response = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=_MAX_RESPONSE_TOKENS,
-            temperature=_TEMPERATURE,
-        )
-        text = _extract_text_from_openai_like(response)
-    elif provider_norm == "google":
-        model_client = client.GenerativeModel(model_name=model)
-        response = model_client.generate_content(
-            prompt,
-            generation_config={
-                "temperature": _TEMPERATURE,
-                "max_output_tokens": _MAX_RESPONSE_TOKENS,
-            },
-        )
-        text = str(getattr(response, "text", "")).strip()
-    elif provider_norm == "groq":
-        response = client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=_MAX_RESPONSE_TOKENS,
-            temperature=_TEMPERATURE,
-        )
-        text = _extract_text_from_openai_like(response)
-    else:
+    handler = _GENERATE_HANDLERS.get(provider.lower().strip())
+    if handler is None:
         supported = ", ".join(sorted(MODEL_DEFAULTS))
         raise ValueError(f"Unsupported provider '{provider}'. Supported providers: {supported}.")
 
+    text = handler(client, prompt, model)
     if not text:
         raise RuntimeError(
             f"Provider '{provider}' returned an empty response for prompt: {prompt!r}"
@@ -151,14 +196,117 @@ def generate_response(client: Any, provider: str, prompt: str, model: str) -> st
     return text
 
 
-def run(provider: str, output: Path, probe_ids: Optional[Sequence[str]] = None) -> Dict[str, Any]:
-    """Run probes against a provider and return a full session results payload."""
+def _serialize_results(results: Dict[str, Any]) -> bytes:
+    """Encode a results payload as indented UTF-8 JSON.
+
+    Uses ``orjson`` when installed, otherwise the stdlib encoder. Both decode to
+    the same values, but the bytes can differ: orjson writes small floats such
+    as ``1e-05`` without an exponent.
+    """
+    if orjson is not None:
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2)
+    return json.dumps(results, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _response_cache_path(cache_dir: Path, provider: str, prompt: str, model: str) -> Path:
+    """Return the cache file for one (provider, model, settings, prompt) call."""
+    raw_key = f"{provider.lower().strip()}|{model}|{_TEMPERATURE}|{_MAX_RESPONSE_TOKENS}|{prompt}"
+    key = hashlib.blake2b(raw_key.encode("utf-8"), digest_size=16).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def _cached_generate_response(
+    client: Any, provider: str, prompt: str, model: str, cache_dir: Path
+) -> str:
+    """Return a cached response text, calling the provider only on a miss.
+
+    Unreadable entries count as misses, and failures to store a new entry are
+    ignored so the provider response is still returned.
+    """
+    path = _response_cache_path(cache_dir, provider, prompt, model)
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            return str(json.load(handle)["text"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    text = generate_response(client, provider, prompt, model)
+
+    # Storing is best-effort: an unwritable cache must not discard a paid response.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump({"text": text}, handle, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    return text
+
+
+def _generate_all(
+    client: Any,
+    provider: str,
+    prompts: Sequence[str],
+    model: str,
+    concurrency: int,
+    cache_dir: Optional[Path] = None,
+) -> List[str]:
+    """Generate responses for ``prompts``, returned in submission order."""
+
+    def _generate(prompt: str) -> str:
+        if cache_dir is None:
+            return generate_response(client, provider, prompt, model)
+        return _cached_generate_response(client, provider, prompt, model, cache_dir)
+
+    workers = min(concurrency, len(prompts))
+    if workers <= 1:
+        return [_generate(prompt) for prompt in prompts]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_generate, prompts))
+
+
+def run(
+    provider: str,
+    output: Path,
+    probe_ids: Optional[Sequence[str]] = None,
+    concurrency: int = 1,
+    cache_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Run probes against a provider and return a full session results payload.
+
+    With ``concurrency`` above 1, provider calls run on a thread pool. Prior
+    responses for ``ici`` are still taken in probe (submission) order.
+
+    When ``cache_dir`` is given, or ``RC_BASELINE_CACHE=1`` is set (which uses
+    ``~/.cache/rc-baseline``), response texts are replayed from disk for calls
+    already made with the same provider, model, settings, and prompt.
+
+    Raises:
+        ValueError: If ``concurrency`` is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}.")
+
+    if cache_dir is None and os.environ.get(_CACHE_ENV_VAR) == "1":
+        cache_dir = _DEFAULT_CACHE_DIR.expanduser()
+
     probes = load_probes(Path(__file__).with_name("probes.yaml"))
 
-    selected_ids = {item.strip() for item in (probe_ids or []) if item.strip()}
+    selected_ids = frozenset(item.strip() for item in (probe_ids or []) if item.strip())
     if selected_ids:
-        probes = [probe for probe in probes if probe.get("id") in selected_ids]
-        found_ids = {probe.get("id") for probe in probes}
+        filtered: List[Dict[str, Any]] = []
+        found_ids = set()
+        for probe in probes:
+            probe_id = probe.get("id")
+            if probe_id in selected_ids:
+                filtered.append(probe)
+                found_ids.add(probe_id)
+        probes = filtered
         missing_ids = selected_ids - found_ids
         if missing_ids:
             missing_list = ", ".join(sorted(missing_ids))
@@ -167,22 +315,40 @@ def run(provider: str, output: Path, probe_ids: Optional[Sequence[str]] = None)
     client = get_client(provider)
     model_name = MODEL_DEFAULTS[provider]
 
-    prior_responses: List[str] = []
-    per_probe: List[Dict[str, Any]] = []
-
+    prompts = [str(probe.get("prompt", "")) for probe in probes]
+    metric_probes: List[Dict[str, Any]] = []
     for probe in probes:
-        prompt = str(probe.get("prompt", ""))
-        response_text = generate_response(client, provider, prompt, model_name)
-
         metric_probe = {
-            "instability_signals": (
-                probe.get("scoring", {}).get("instability_signals", [])
-            )
+            "instability_signals": probe.get("scoring", {}).get("instability_signals", [])
         }
+        lower_signals(metric_probe)
+        metric_probes.append(metric_probe)
 
+    responses = _generate_all(client, provider, prompts, model_name, concurrency, cache_dir)
+
+    prior_responses: List[str] = []
+    prior_token_sets: List[FrozenSet[str]] = []
+    token_history: Optional[TokenBitsetHistory] = None
+    per_probe: List[Dict[str, Any]] = []
+    sum_rsi = sum_avs = sum_ici = sum_composite = 0.0
+
+    for probe, metric_probe, prompt, response_text in zip(
+        probes, metric_probes, prompts, responses
+    ):
         probe_rsi = rsi(response_text, metric_probe, prior_responses)
         probe_avs = avs(response_text, metric_probe, prior_responses)
-        probe_ici = ici(response_text, metric_probe, prior_responses)
+        response_tokens = _tokenize(response_text)
+        if token_history is None and len(prior_token_sets) >= _BITSET_HISTORY_THRESHOLD:
+            token_history = TokenBitsetHistory()
+            for prior_tokens in prior_token_sets:
+                token_history.append(prior_tokens)
+            prior_token_sets.clear()
+        if token_history is None:
+            probe_ici = ici_from_tokens(response_tokens, prior_token_sets)
+            prior_token_sets.append(response_tokens)
+        else:
+            probe_ici = ici_from_history(response_tokens, token_history)
+            token_history.append(response_tokens)
         composite = mean([probe_rsi, probe_avs, probe_ici])
 
         per_probe.append(
@@ -196,14 +362,19 @@ def run(provider: str, output: Path, probe_ids: Optional[Sequence[str]] = None)
                 "composite": composite,
             }
         )
+        sum_rsi += probe_rsi
+        sum_avs += probe_avs
+        sum_ici += probe_ici
+        sum_composite += composite
         prior_responses.append(response_text)
 
-    if per_probe:
+    count = len(per_probe)
+    if count:
         summary = {
-            "mean_rsi": mean(item["rsi"] for item in per_probe),
-            "mean_avs": mean(item["avs"] for item in per_probe),
-            "mean_ici": mean(item["ici"] for item in per_probe),
-            "mean_composite": mean(item["composite"] for item in per_probe),
+            "mean_rsi": sum_rsi / count,
+            "mean_avs": sum_avs / count,
+            "mean_ici": sum_ici / count,
+            "mean_composite": sum_composite / count,
         }
     else:
         summary = {"mean_rsi": 0.0, "mean_avs": 0.0, "mean_ici": 0.0, "mean_composite": 0.0}
@@ -216,8 +387,13 @@ def run(provider: str, output: Path, probe_ids: Optional[Sequence[str]] = None)
     }
 
     output.parent.mkdir(parents=True, exist_ok=True)
-    with output.open("w", encoding="utf-8") as handle:
-        json.dump(results, handle, ensure_ascii=False, indent=2)
+    tmp_output = output.with_name(f"{output.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_output.write_bytes(_serialize_results(results))
+        os.replace(tmp_output, output)
+    except BaseException:
+        tmp_output.unlink(missing_ok=True)
+        raise
 
     return results
 
@@ -240,6 +416,20 @@ def _build_parser() -> argparse.ArgumentParser:
         default="",
         help="Comma-separated probe IDs to run. By default, runs all probes.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of provider calls to run in parallel (default: 1).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help=(
+            "Replay responses from this directory and store new ones there. "
+            f"Setting {_CACHE_ENV_VAR}=1 uses ~/.cache/rc-baseline."
+        ),
+    )
     return parser
 
 
@@ -260,7 +450,13 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     probe_ids = [item.strip() for item in args.probe_ids.split(",") if item.strip()]
 
     try:
-        results = run(provider=args.provider, output=Path(args.output), probe_ids=probe_ids)
+        results = run(
+            provider=args.provider,
+            output=Path(args.output),
+            probe_ids=probe_ids,
+            concurrency=args.concurrency,
+            cache_dir=Path(args.cache_dir) if args.cache_dir else None,
+        )
     except (RuntimeError, ValueError, ImportError, OSError) as exc:
         parser.exit(status=1, message=f"Error: {exc}\n")
 
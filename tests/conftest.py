@@ -0,0 +1,64 @@
+"""Shared pytest fixtures for baseline tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Sequence, Tuple
+
+import pytest
+
+from baseline import run_baseline
+
+
+class _DummyClient:
+    """Sentinel client object for tests."""
+
+
+@pytest.fixture(scope="session")
+def default_probes() -> Tuple[Mapping[str, Any], ...]:
+    """Two read-only probes shared by runner tests."""
+    return (
+        MappingProxyType(
+            {
+                "id": "p1",
+                "prompt": "Prompt one",
+                "scoring": {"instability_signals": ("panic",)},
+            }
+        ),
+        MappingProxyType(
+            {
+                "id": "p2",
+                "prompt": "Prompt two",
+                "scoring": {"instability_signals": ("contradict",)},
+            }
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def out_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-wide directory for runner output; tests pick unique file names."""
+    return tmp_path_factory.mktemp("baseline")
+
+
+@pytest.fixture
+def patch_runner(
+    monkeypatch: pytest.MonkeyPatch, default_probes: Tuple[Mapping[str, Any], ...]
+) -> Callable[..., None]:
+    """Return a helper that stubs probe loading, client creation, and generation.
+
+    The helper takes the ``generate_response`` replacement and, optionally, the
+    probes to serve instead of ``default_probes``.
+    """
+
+    def _apply(
+        generate: Callable[[Any, str, str, str], str],
+        probes: Optional[Sequence[Mapping[str, Any]]] = None,
+    ) -> None:
+        served = list(default_probes if probes is None else probes)
+        monkeypatch.setattr(run_baseline, "load_probes", lambda _: served)
+        monkeypatch.setattr(run_baseline, "get_client", lambda provider: _DummyClient())
+        monkeypatch.setattr(run_baseline, "generate_response", generate)
+
+    return _apply
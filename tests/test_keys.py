@@ -18,6 +18,8 @@ def clear_key_env(monkeypatch):
         "GROQ_API_KEY",
     ):
         monkeypatch.delenv(env_var, raising=False)
+    keys.clear_key_cache()
+    keys.reset_clients()
 
 
 def test_validate_all_partitions_providers(monkeypatch):
@@ -56,3 +58,40 @@ def test_get_groq_api_key_raises_clear_error_when_missing():
     """Provider key getter should raise a clear missing key message."""
     with pytest.raises(RuntimeError, match="GROQ_API_KEY"):
         keys.get_groq_api_key()
+
+
+def test_api_key_is_cached_until_cache_is_cleared(monkeypatch):
+    """Key getters should reuse the first resolved value until the cache is cleared."""
+    monkeypatch.setenv("OPENAI_API_KEY", "first-key")
+    assert keys.get_openai_api_key() == "first-key"
+
+    monkeypatch.setenv("OPENAI_API_KEY", "second-key")
+    assert keys.get_openai_api_key() == "first-key"
+
+    keys.clear_key_cache()
+    keys.reset_clients()
+    assert keys.get_openai_api_key() == "second-key"
+
+
+def test_get_client_reuses_cached_client(monkeypatch):
+    """get_client should construct each provider client only once."""
+    constructed = []
+
+    class FakeGroq:
+        def __init__(self, api_key):
+            constructed.append(api_key)
+
+    monkeypatch.setitem(sys.modules, "groq", types.SimpleNamespace(Groq=FakeGroq))
+    monkeypatch.setenv("GROQ_API_KEY", "groq-test-key")
+
+    first = keys.get_client("groq")
+    second = keys.get_client(" Groq ")
+
+    assert first is second
+    assert constructed == ["groq-test-key"]
+
+
+def test_get_client_rejects_unknown_provider():
+    """get_client should list supported providers for unknown names."""
+    with pytest.raises(ValueError, match="anthropic, google, groq, openai"):
+        keys.get_client("mistral")
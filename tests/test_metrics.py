@@ -1,8 +1,12 @@
 """Tests for baseline metric implementations."""
 
+import pytest
+
+from baseline.metrics._bitset import TokenBitsetHistory
+from baseline.metrics._text import _tokenize
 from baseline.metrics.avs import avs
 from baseline.metrics.drift import drift
-from baseline.metrics.ici import ici
+from baseline.metrics.ici import ici, ici_from_history, ici_from_tokens
 from baseline.metrics.rsi import rsi
 
 
@@ -30,6 +34,14 @@ def test_rsi_counts_instability_signals():
     assert rsi(response, probe) == 1.0 - (2 / 3)
 
 
+def test_rsi_caches_lowercased_signals_on_probe():
+    """RSI should match signals case-insensitively and cache the lowered tuple."""
+    probe = {"instability_signals": ["PANIC", "Contradict"]}
+
+    assert rsi("i panic", probe) == 0.5
+    assert probe["_instability_signals_lower"] == ("panic", "contradict")
+
+
 def test_avs_uses_anchor_phrase_matches_with_cap():
     """AVS should increase with anchor matches and cap at 1.0."""
     response = "I think this is correct. My understanding is evolving. I'm uncertain."
@@ -46,6 +58,41 @@ def test_ici_averages_jaccard_similarity_against_priors():
     assert ici(response, {}, prior_responses) == (1.0 + (1 / 3)) / 2
 
 
+def test_ici_from_tokens_matches_ici_on_raw_text():
+    """Pre-tokenized ICI should agree with the text-based ICI."""
+    response = "alpha beta"
+    prior_responses = ["alpha beta", "alpha gamma"]
+
+    expected = ici(response, {}, prior_responses)
+    tokens = [_tokenize(prior) for prior in prior_responses]
+    assert ici_from_tokens(_tokenize(response), tokens) == expected
+
+
+def test_ici_from_history_matches_ici_from_tokens():
+    """Bitset-packed ICI should agree with set-based ICI as the history grows."""
+    responses = ["alpha beta", "alpha gamma", "", "gamma delta epsilon", "beta"]
+    history = TokenBitsetHistory()
+    prior_token_sets = []
+
+    for response in responses:
+        tokens = _tokenize(response)
+        expected = ici_from_tokens(tokens, prior_token_sets)
+        assert ici_from_history(tokens, history) == pytest.approx(expected)
+        history.append(tokens)
+        prior_token_sets.append(tokens)
+
+
+def test_ici_ignores_punctuation_attached_to_words():
+    """Tokenization should treat "beta," and "beta" as the same word."""
+    assert ici("Alpha, beta!", {}, ["alpha beta"]) == 1.0
+
+
+def test_tokenize_drops_quotes_but_keeps_contractions():
+    """Quoted words should match their bare form; contractions stay one token."""
+    assert _tokenize("said 'hello' ' I'm ok") == frozenset({"said", "hello", "i'm", "ok"})
+    assert ici("'stable'", {}, ["stable"]) == 1.0
+
+
 def test_ici_returns_one_when_no_prior_responses():
     """ICI should return 1.0 when no prior responses are provided."""
     assert ici("any response", {}, []) == 1.0
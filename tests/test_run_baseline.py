@@ -3,64 +3,62 @@
 from __future__ import annotations
 
 import json
+import os
+import uuid
 from pathlib import Path
-from typing import Any, Dict, List
+from statistics import fmean
+from types import SimpleNamespace
+from typing import Any, Callable, List
 
 import pytest
 
 from baseline import run_baseline
+from baseline.metrics.ici import ici
 
 
-class _DummyClient:
-    """Sentinel client object for tests."""
+class _Responder:
+    """``generate_response`` stub returning canned responses in call order."""
 
+    __slots__ = ("data", "index")
 
-def test_run_computes_summary_and_writes_json(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    """Runner should persist complete results and consistent summary means."""
-    probes: List[Dict[str, Any]] = [
-        {
-            "id": "p1",
-            "prompt": "Prompt one",
-            "scoring": {"instability_signals": ["panic"]},
-        },
-        {
-            "id": "p2",
-            "prompt": "Prompt two",
-            "scoring": {"instability_signals": ["contradict"]},
-        },
-    ]
+    def __init__(self, data: List[str]) -> None:
+        self.data = data
+        self.index = 0
 
-    responses = iter(
-        [
-            "I think this is grounded.",
-            "I think my understanding is stable.",
-        ]
-    )
+    def __call__(self, *_: Any) -> str:
+        response = self.data[self.index]
+        self.index += 1
+        return response
 
-    monkeypatch.setattr(run_baseline, "load_probes", lambda _: probes)
-    monkeypatch.setattr(run_baseline, "get_client", lambda provider: _DummyClient())
-    monkeypatch.setattr(
-        run_baseline,
-        "generate_response",
-        lambda client, provider, prompt, model: next(responses),
+
+def test_run_computes_summary_and_writes_json(out_dir: Path, patch_runner: Callable[..., None]) -> None:
+    """Runner should persist complete results and consistent summary means."""
+    patch_runner(
+        _Responder(
+            [
+                "I think this is grounded.",
+                "I think my understanding is stable.",
+            ]
+        )
     )
 
-    output = tmp_path / "out" / "results.json"
+    output = out_dir / uuid.uuid4().hex / "results.json"
     result = run_baseline.run("openai", output)
 
     assert output.exists()
-    with output.open("r", encoding="utf-8") as handle:
-        persisted = json.load(handle)
+    persisted = json.loads(output.read_bytes())
 
     assert persisted["provider"] == "openai"
     assert len(persisted["results"]) == 2
+    assert persisted["results"] == result["results"]
+    assert persisted["summary"] == result["summary"]
 
     summary = result["summary"]
-    mean_composite = sum(item["composite"] for item in result["results"]) / 2
+    mean_composite = fmean(item["composite"] for item in result["results"])
     assert summary["mean_composite"] == pytest.approx(mean_composite)
 
 
-def test_run_rejects_unknown_probe_ids(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_run_rejects_unknown_probe_ids(out_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Runner should fail clearly when requested probe IDs are not found."""
     monkeypatch.setattr(
         run_baseline,
@@ -71,6 +69,187 @@ def test_run_rejects_unknown_probe_ids(tmp_path: Path, monkeypatch: pytest.Monke
     with pytest.raises(ValueError, match="Unknown probe id"):
         run_baseline.run(
             provider="openai",
-            output=tmp_path / "results.json",
+            output=out_dir / f"results_{uuid.uuid4().hex}.json",
             probe_ids=["unknown"],
         )
+
+
+def test_run_concurrent_keeps_probe_order(out_dir: Path, patch_runner: Callable[..., None]) -> None:
+    """Concurrent runs should report results in probe order, not completion order."""
+    probes = [{"id": f"p{index}", "prompt": f"Prompt {index}", "scoring": {}} for index in range(4)]
+
+    patch_runner(lambda client, provider, prompt, model: f"answer to {prompt}", probes)
+
+    output = out_dir / f"results_{uuid.uuid4().hex}.json"
+    result = run_baseline.run("openai", output, concurrency=3)
+
+    assert [item["probe_id"] for item in result["results"]] == ["p0", "p1", "p2", "p3"]
+    assert [item["response"] for item in result["results"]] == [
+        f"answer to Prompt {index}" for index in range(4)
+    ]
+
+
+def test_run_output_matches_json_dump(
+    out_dir: Path, patch_runner: Callable[..., None], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Without orjson, persisted output should equal an indented json.dump of the payload."""
+    monkeypatch.setattr(run_baseline, "orjson", None)
+    patch_runner(lambda client, provider, prompt, model: f"I think \"{prompt}\"\nis café.")
+
+    output = out_dir / f"results_{uuid.uuid4().hex}.json"
+    result = run_baseline.run("openai", output)
+
+    assert output.read_text(encoding="utf-8") == json.dumps(result, ensure_ascii=False, indent=2)
+    assert list(output.parent.glob(f"{output.name}.*.tmp")) == []
+
+
+def test_serialize_results_with_orjson_decodes_to_same_values() -> None:
+    """orjson output may format floats differently but must decode identically."""
+    pytest.importorskip("orjson")
+    payload = {
+        "provider": "openai",
+        "results": [{"response": "café \"quoted\"\nline", "ici": 6.93e-05, "rsi": 1e-05}],
+        "summary": {"mean_ici": 2 / 3},
+    }
+
+    assert json.loads(run_baseline._serialize_results(payload)) == payload
+
+
+def test_load_probes_reparses_only_after_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """load_probes should reuse the parsed file until its mtime changes."""
+    parses: List[Path] = []
+    real_load = run_baseline.yaml.load
+
+    def counting_load(stream: Any, Loader: Any) -> Any:
+        parses.append(path)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(run_baseline.yaml, "load", counting_load)
+
+    path = tmp_path / "probes.yaml"
+    path.write_text("probes:\n  - id: first\n", encoding="utf-8")
+
+    run_baseline.load_probes(path)
+    run_baseline.load_probes(path)
+    assert len(parses) == 1
+
+    path.write_text("probes:\n  - id: second\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert [probe["id"] for probe in run_baseline.load_probes(path)] == ["second"]
+    assert len(parses) == 2
+
+
+def test_load_probes_returns_independent_copies(tmp_path: Path) -> None:
+    """Mutating loaded probes should not leak into later loads of the same file."""
+    path = tmp_path / "probes.yaml"
+    path.write_text(
+        "probes:\n  - id: first\n    scoring:\n      instability_signals: [panic]\n",
+        encoding="utf-8",
+    )
+
+    first = run_baseline.load_probes(path)
+    first[0]["id"] = "changed"
+    first[0]["scoring"]["instability_signals"].append("extra")
+
+    second = run_baseline.load_probes(path)
+    assert second[0]["id"] == "first"
+    assert second[0]["scoring"]["instability_signals"] == ["panic"]
+
+
+def test_load_probes_rejects_missing_probe_list(tmp_path: Path) -> None:
+    """load_probes should fail clearly when the file has no probes list."""
+    path = tmp_path / "probes.yaml"
+    path.write_text("other: 1\n", encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="expected list at 'probes'"):
+        run_baseline.load_probes(path)
+
+
+def test_generate_response_dispatches_openai_like_providers() -> None:
+    """Groq should share the OpenAI-style chat completion handler."""
+    message = SimpleNamespace(content=" hello ")
+    completions = SimpleNamespace(
+        create=lambda **kwargs: SimpleNamespace(choices=[SimpleNamespace(message=message)])
+    )
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    assert run_baseline.generate_response(client, " Groq ", "hi", "model") == "hello"
+
+    with pytest.raises(ValueError, match="Unsupported provider"):
+        run_baseline.generate_response(client, "mistral", "hi", "model")
+
+
+def test_run_replays_cached_responses(tmp_path: Path, patch_runner: Callable[..., None]) -> None:
+    """A cached run should not call the provider again for the same prompts."""
+    calls: List[str] = []
+
+    def fake_generate(client: Any, provider: str, prompt: str, model: str) -> str:
+        calls.append(prompt)
+        return f"answer to {prompt}"
+
+    patch_runner(fake_generate)
+
+    cache_dir = tmp_path / "cache"
+    first = run_baseline.run("openai", tmp_path / "first.json", cache_dir=cache_dir)
+    second = run_baseline.run("openai", tmp_path / "second.json", cache_dir=cache_dir)
+
+    assert calls == ["Prompt one", "Prompt two"]
+    assert second["results"] == first["results"]
+
+
+def test_run_ici_agrees_across_bitset_threshold(
+    out_dir: Path, patch_runner: Callable[..., None], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """ICI should match the text-based metric before and after the bitset switch."""
+    probes = [{"id": f"p{index}", "prompt": f"Prompt {index}", "scoring": {}} for index in range(6)]
+    texts = ["alpha beta", "beta gamma", "alpha delta", "gamma", "alpha beta gamma", "epsilon"]
+
+    monkeypatch.setattr(run_baseline, "_BITSET_HISTORY_THRESHOLD", 3)
+    patch_runner(_Responder(texts), probes)
+
+    result = run_baseline.run("openai", out_dir / f"results_{uuid.uuid4().hex}.json")
+
+    for index, item in enumerate(result["results"]):
+        assert item["ici"] == pytest.approx(ici(texts[index], {}, texts[:index]))
+
+
+@pytest.mark.parametrize("entry", ["[]", "\"text\"", "{}", "not json"])
+def test_cached_generate_response_treats_malformed_entry_as_miss(tmp_path: Path, entry: str) -> None:
+    """Unreadable cache entries should fall through to the provider call."""
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    path = run_baseline._response_cache_path(cache_dir, "openai", "Prompt", "model")
+    path.write_text(entry, encoding="utf-8")
+
+    message = SimpleNamespace(content="fresh")
+    completions = SimpleNamespace(
+        create=lambda **kwargs: SimpleNamespace(choices=[SimpleNamespace(message=message)])
+    )
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    text = run_baseline._cached_generate_response(client, "openai", "Prompt", "model", cache_dir)
+
+    assert text == "fresh"
+    assert json.loads(path.read_text(encoding="utf-8")) == {"text": "fresh"}
+
+
+def test_cached_generate_response_ignores_cache_write_failures(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A failed cache store should still return the provider text and leave no temp file."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(run_baseline, "generate_response", lambda *_: "fresh")
+
+    def failing_replace(src: Any, dst: Any) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(run_baseline.os, "replace", failing_replace)
+
+    text = run_baseline._cached_generate_response(None, "openai", "Prompt", "model", cache_dir)
+
+    assert text == "fresh"
+    assert list(cache_dir.iterdir()) == []